@@ -19,72 +19,52 @@ Creates an index page for each programming language with links to all its concep
 Fixes breadcrumb 404s in concept pages.
 """
 
+import hashlib
 import os
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from helper import load_from_yaml, get_safename
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DOCS_DIR = os.path.join(SCRIPT_DIR, '..', 'docs')
 CONTENT_DIR = os.path.join(DOCS_DIR, 'content-autogen', 'gpt_3_5_turbo')
 CONCEPTS_DIR = os.path.join(DOCS_DIR, 'concepts')
 PROG_LANGS_YAML = os.path.join(DOCS_DIR, 'prog_langs.yaml')
+KEYS_CACHE_FILE = os.path.join(SCRIPT_DIR, '..', '.cache', 'landing_keys.json')
 
 # Base URL
 BASE_URL = 'https://prog-lang-compare.netlify.app'
 
 
-def slugify(text):
-    """Convert text to URL-friendly slug."""
-    return text.lower().replace(' ', '-').replace('.', '-').replace('_', '-').replace('/', '-').replace('(', '').replace(')', '')
+# Concept card markup, filled positionally with (slug, name)
+_CARD = '<div class="concept-card"><a href="{0}.html">{1}</a></div>'
 
+# Single-pass replacement table for slugify
+_SLUG_TRANS = str.maketrans({' ': '-', '.': '-', '_': '-', '/': '-', '(': '', ')': ''})
 
-def generate_language_landing_page(language, concepts):
-    """Generate a landing page for a specific language."""
-    slug = slugify(language)
-    safe_name = get_safename(language)
-    language_display = language.replace('_', ' ')
 
-    # Group concepts by category (first part before underscore)
-    categories = {}
-    for concept_key in concepts:
-        # Extract category from concept key (e.g., "Datatypes_Primitives" -> "Datatypes")
-        parts = concept_key.split('_')
-        if len(parts) > 1:
-            category = parts[0]
-            subconcept = '_'.join(parts[1:])
-
-            if category not in categories:
-                categories[category] = []
-            categories[category].append({
-                'key': concept_key,
-                'name': subconcept.replace('_', ' ').title(),
-                'slug': slugify(concept_key)
-            })
-
-    # Sort categories
-    sorted_categories = sorted(categories.items())
-
-    # Build concept cards HTML
-    all_concepts_html = ""
-    for category, subconcepts in sorted_categories:
-        category_name = category.replace('_', ' ').title()
-        subconcept_cards = ''.join([
-            f'<div class="concept-card"><a href="{sc["slug"]}.html">{sc["name"]}</a></div>'
-            for sc in sorted(subconcepts, key=lambda x: x['name'])
-        ])
+@lru_cache(maxsize=4096)
+def slugify(text):
+    """Convert text to URL-friendly slug."""
+    return text.lower().translate(_SLUG_TRANS)
 
-        all_concepts_html += f"""
-        <section class="category-section">
-            <h3>{category_name}</h3>
-            <div class="grid">
-                {subconcept_cards}
-            </div>
-        </section>
-        """
 
-    html = f"""<!DOCTYPE html>
+# Landing-page shell, formatted once per language via str.format_map.
+# CSS braces are escaped ({{ }}) so only the named placeholders are substituted.
+_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -93,25 +73,25 @@ def generate_language_landing_page(language, concepts):
     <!-- Primary Meta Tags -->
     <title>{language_display} Programming Concepts - Prog Lang Compare</title>
     <meta name="title" content="{language_display} Programming Concepts - Prog Lang Compare">
-    <meta name="description" content="Learn {language_display} programming with {len(concepts)} detailed concept explanations and code examples. Compare syntax, features, and best practices with other languages.">
+    <meta name="description" content="Learn {language_display} programming with {len_concepts} detailed concept explanations and code examples. Compare syntax, features, and best practices with other languages.">
     <meta name="keywords" content="{language_display}, programming, code examples, syntax, tutorial, reference">
 
     <!-- Open Graph / Facebook -->
     <meta property="og:type" content="website">
-    <meta property="og:url" content="{BASE_URL}/concepts/{slug}.html">
+    <meta property="og:url" content="{canonical_url}">
     <meta property="og:title" content="{language_display} Programming Concepts">
-    <meta property="og:description" content="Learn {language_display} with {len(concepts)} detailed concept explanations and code examples.">
-    <meta property="og:image" content="{BASE_URL}/social-preview.png">
+    <meta property="og:description" content="Learn {language_display} with {len_concepts} detailed concept explanations and code examples.">
+    <meta property="og:image" content="{social_image}">
 
     <!-- Twitter -->
     <meta property="twitter:card" content="summary_large_image">
-    <meta property="twitter:url" content="{BASE_URL}/concepts/{slug}.html">
+    <meta property="twitter:url" content="{canonical_url}">
     <meta property="twitter:title" content="{language_display} Programming Concepts">
-    <meta property="twitter:description" content="Learn {language_display} with {len(concepts)} detailed concept explanations.">
-    <meta property="twitter:image" content="{BASE_URL}/social-preview.png">
+    <meta property="twitter:description" content="Learn {language_display} with {len_concepts} detailed concept explanations.">
+    <meta property="twitter:image" content="{social_image}">
 
     <!-- Canonical URL -->
-    <link rel="canonical" href="{BASE_URL}/concepts/{slug}.html">
+    <link rel="canonical" href="{canonical_url}">
 
     <!-- Favicon -->
     <link rel="icon" type="image/svg+xml" href="../favicon.svg">
@@ -279,8 +259,8 @@ def generate_language_landing_page(language, concepts):
         "@context": "https://schema.org",
         "@type": "CollectionPage",
         "name": "{language_display} Programming Concepts",
-        "description": "Learn {language_display} programming with {len(concepts)} detailed concept explanations and code examples.",
-        "url": "{BASE_URL}/concepts/{slug}.html",
+        "description": "Learn {language_display} programming with {len_concepts} detailed concept explanations and code examples.",
+        "url": "{canonical_url}",
         "isPartOf": {{
             "@type": "WebSite",
             "name": "Prog Lang Compare",
@@ -300,17 +280,17 @@ def generate_language_landing_page(language, concepts):
 
     <header>
         <h1>{language_display} Programming Concepts</h1>
-        <p class="intro">Explore {language_display} programming with detailed explanations and code examples across {len(concepts)} concepts.</p>
+        <p class="intro">Explore {language_display} programming with detailed explanations and code examples across {len_concepts} concepts.</p>
     </header>
 
     <div class="stats">
         <div class="stats-grid">
             <div class="stat-item">
-                <div class="stat-number">{len(concepts)}</div>
+                <div class="stat-number">{len_concepts}</div>
                 <div class="stat-label">Concepts Covered</div>
             </div>
             <div class="stat-item">
-                <div class="stat-number">{len(categories)}</div>
+                <div class="stat-number">{len_categories}</div>
                 <div class="stat-label">Categories</div>
             </div>
         </div>
@@ -327,16 +307,128 @@ def generate_language_landing_page(language, concepts):
 </body>
 </html>"""
 
-    # Save the page
+
+def generate_language_landing_page(language, concepts):
+    """Generate a landing page for a specific language."""
+    slug = slugify(language)
+    safe_name = get_safename(language)
+    language_display = language.replace('_', ' ')
+
+    # Build the repeated header URLs once per page
+    canonical_url = f'{BASE_URL}/concepts/{slug}.html'
+    social_image = f'{BASE_URL}/social-preview.png'
+
+    # Group concepts by category (first part before underscore)
+    categories = {}
+    for concept_key in concepts:
+        # Extract category from concept key (e.g., "Datatypes_Primitives" -> "Datatypes")
+        parts = concept_key.split('_', 1)
+        if len(parts) == 2:
+            category, subconcept = parts
+            categories.setdefault(category, []).append(
+                (subconcept.replace('_', ' ').title(), slugify(concept_key))
+            )
+
+    # Sort categories
+    sorted_categories = sorted(categories.items())
+
+    # Build concept cards HTML
+    sections = []
+    for category, subconcepts in sorted_categories:
+        category_name = category.replace('_', ' ').title()
+        subconcept_cards = ''.join(
+            _CARD.format(slug, name) for name, slug in sorted(subconcepts)
+        )
+
+        sections.append(f"""
+        <section class="category-section">
+            <h3>{category_name}</h3>
+            <div class="grid">
+                {subconcept_cards}
+            </div>
+        </section>
+        """)
+
+    all_concepts_html = ''.join(sections)
+
+    html = _TEMPLATE.format_map({
+        'language_display': language_display,
+        'canonical_url': canonical_url,
+        'social_image': social_image,
+        'len_concepts': len(concepts),
+        'len_categories': len(categories),
+        'all_concepts_html': all_concepts_html,
+        'BASE_URL': BASE_URL,
+    })
+
+    # Save the page with a single low-level write of the pre-encoded bytes,
+    # skipping the buffered file-object layer
     output_path = os.path.join(CONCEPTS_DIR, f'{slug}.html')
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    page_bytes = html.encode('utf-8')
+
+    # Skip the write when the rendered page is byte-identical — keeps the
+    # mtime stable for the sitemap's last-modified fallback
+    new_digest = hashlib.blake2b(page_bytes, digest_size=16).digest()
+    try:
+        with open(output_path, 'rb') as f:
+            if hashlib.blake2b(f.read(), digest_size=16).digest() == new_digest:
+                return output_path
+    except OSError:
+        pass
+
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, page_bytes)
+    finally:
+        os.close(fd)
 
     return output_path
 
 
+def _load_concept_keys(json_file):
+    """Load only the top-level concept keys from a language JSON file.
+
+    The landing pages never use the markdown bodies, so stream just the
+    keys with ijson when it is installed; fall back to a full parse with
+    orjson (C-level UTF-8 decode) or stdlib json.
+    """
+    with open(json_file, 'rb') as f:
+        if ijson is not None:
+            return [key for key, _ in ijson.kvitems(f, '')]
+        if orjson is not None:
+            return list(orjson.loads(f.read()).keys())
+        return list(json.load(f).keys())
+
+
+def _load_keys_cache():
+    """Load the persisted {language: [mtime, size, keys]} cache."""
+    try:
+        with open(KEYS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_keys_cache(keys_cache):
+    """Persist the concept-keys cache for the next run."""
+    os.makedirs(os.path.dirname(KEYS_CACHE_FILE), exist_ok=True)
+    with open(KEYS_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(keys_cache, f)
+
+
+def _render_one(lang, json_file, concept_keys=None):
+    """Worker: render a single landing page in its own process.
+
+    Loads the concept keys itself unless the parent passed cached ones.
+    """
+    if concept_keys is None:
+        concept_keys = _load_concept_keys(json_file)
+    output_path = generate_language_landing_page(lang, concept_keys)
+    return concept_keys, output_path
+
+
 def generate_all_language_landing_pages():
     """Generate landing pages for all languages."""
 
@@ -357,28 +449,44 @@ def generate_all_language_landing_pages():
     print("")
 
     generated_count = 0
-
-    for lang in languages:
-        safe_lang = get_safename(lang)
-        json_file = os.path.join(CONTENT_DIR, f'{safe_lang}.json')
-
-        if not os.path.exists(json_file):
-            print(f"⚠ Warning: JSON file not found for {lang}: {json_file}")
-            continue
-
-        try:
-            # Load language content
-            with open(json_file, 'r', encoding='utf-8') as f:
-                content = json.load(f)
-
-            # Generate landing page
-            output_path = generate_language_landing_page(lang, list(content.keys()))
-
-            print(f"✓ Generated: {lang} ({len(content)} concepts) -> {os.path.basename(output_path)}")
-            generated_count += 1
-
-        except Exception as e:
-            print(f"✗ Error generating {lang}: {e}")
+    keys_cache = _load_keys_cache()
+
+    # Each language is independent (pure template formatting + one file
+    # write), so fan the work out across processes
+    with ProcessPoolExecutor() as executor:
+        futures = {}
+        for lang in languages:
+            safe_lang = get_safename(lang)
+            json_file = os.path.join(CONTENT_DIR, f'{safe_lang}.json')
+
+            if not os.path.exists(json_file):
+                print(f"⚠ Warning: JSON file not found for {lang}: {json_file}")
+                continue
+
+            # Reuse cached concept keys when the JSON file is unchanged
+            stat = os.stat(json_file)
+            cached = keys_cache.get(safe_lang)
+            if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                cached_keys = cached[2]
+            else:
+                cached_keys = None
+
+            future = executor.submit(_render_one, lang, json_file, cached_keys)
+            futures[future] = (lang, safe_lang, stat)
+
+        for future in as_completed(futures):
+            lang, safe_lang, stat = futures[future]
+            try:
+                concept_keys, output_path = future.result()
+                keys_cache[safe_lang] = [stat.st_mtime, stat.st_size, concept_keys]
+
+                print(f"✓ Generated: {lang} ({len(concept_keys)} concepts) -> {os.path.basename(output_path)}")
+                generated_count += 1
+
+            except Exception as e:
+                print(f"✗ Error generating {lang}: {e}")
+
+    _save_keys_cache(keys_cache)
 
     print("")
     print(f"✓ Successfully generated {generated_count} language landing pages!")
@@ -5,9 +5,8 @@ Includes the main index page and all concept pages.
 """
 
 import os
-import glob
 from datetime import datetime
-from xml.etree.ElementTree import Element, SubElement, ElementTree
+from xml.sax.saxutils import escape
 import subprocess
 
 # Paths
@@ -18,23 +17,58 @@ SITEMAP_FILE = os.path.join(DOCS_DIR, 'sitemap.xml')
 # Base URL
 BASE_URL = 'https://prog-lang-compare.netlify.app'
 
+# Relative-path prefix marking pages under docs/concepts/
+_CONCEPTS_PREFIX = 'concepts' + os.sep
 
-def get_git_last_modified(file_path):
-    """Get the last modified date of a file from git history."""
+# Lazily built {repo-relative path: YYYY-MM-DD} index from a single git log walk
+_git_date_index = None
+
+
+def _build_git_mtime_index():
+    """Build a {path: last modified date} index with a single git log call.
+
+    Walks the full history once (newest first) and records the date of the
+    most recent commit touching each file, instead of spawning one git
+    subprocess per page.
+    """
+    index = {}
     try:
         result = subprocess.run(
-            ['git', 'log', '-1', '--format=%cI', file_path],
+            ['git', 'log', '--name-only', '--format=%x00%cI', 'HEAD'],
             capture_output=True,
             text=True,
             cwd=DOCS_DIR
         )
-        if result.returncode == 0 and result.stdout.strip():
-            # Parse ISO 8601 date and convert to W3C Datetime format
-            date_str = result.stdout.strip()
-            # Just return the date part (YYYY-MM-DD)
-            return date_str.split('T')[0]
+        if result.returncode == 0 and result.stdout:
+            # Each commit block starts with a NUL byte followed by its ISO date
+            for block in result.stdout.split('\x00'):
+                lines = block.splitlines()
+                if not lines:
+                    continue
+                # Just keep the date part (YYYY-MM-DD)
+                date_str = lines[0].split('T')[0]
+                for path in lines[1:]:
+                    if path and path not in index:
+                        index[path] = date_str
     except Exception as e:
-        print(f"Warning: Could not get git date for {file_path}: {e}")
+        print(f"Warning: Could not build git date index: {e}")
+
+    return index
+
+
+def get_git_last_modified(file_path):
+    """Get the last modified date of a file from git history."""
+    global _git_date_index
+    if _git_date_index is None:
+        _git_date_index = _build_git_mtime_index()
+
+    # git log prints paths relative to the repo root with forward slashes
+    repo_root = os.path.join(os.path.dirname(__file__), '..')
+    rel_path = os.path.relpath(file_path, repo_root).replace(os.sep, '/')
+
+    date_str = _git_date_index.get(rel_path)
+    if date_str:
+        return date_str
 
     # Fallback to file modification time
     try:
@@ -44,75 +78,84 @@ def get_git_last_modified(file_path):
         return datetime.now().strftime('%Y-%m-%d')
 
 
-def generate_sitemap():
-    """Generate the sitemap.xml file."""
-
-    print("Generating sitemap.xml...")
+def _iter_html(root):
+    """Yield all .html file paths under root using a non-recursive scandir walk."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.html'):
+                    yield entry.path
 
-    # Create root element
-    urlset = Element('urlset')
-    urlset.set('xmlns', 'http://www.sitemaps.org/schemas/sitemap/0.9')
 
-    # Add main index page
-    url = SubElement(urlset, 'url')
-    loc = SubElement(url, 'loc')
-    loc.text = f'{BASE_URL}/'
-    lastmod = SubElement(url, 'lastmod')
-    lastmod.text = get_git_last_modified(os.path.join(DOCS_DIR, 'index.html'))
-    changefreq = SubElement(url, 'changefreq')
-    changefreq.text = 'weekly'
-    priority = SubElement(url, 'priority')
-    priority.text = '1.0'
+def _write_url_entry(out, url, lastmod, changefreq, priority):
+    """Write a single pretty-printed <url> entry."""
+    out.write(
+        f'  <url>\n'
+        f'    <loc>{escape(url)}</loc>\n'
+        f'    <lastmod>{lastmod}</lastmod>\n'
+        f'    <changefreq>{changefreq}</changefreq>\n'
+        f'    <priority>{priority}</priority>\n'
+        f'  </url>\n'
+    )
 
-    print(f"Added main index page")
 
-    # Add all concept pages
-    page_count = 0
-    if os.path.exists(CONCEPTS_DIR):
-        # Find all HTML files in concepts directory
-        html_files = glob.glob(os.path.join(CONCEPTS_DIR, '**', '*.html'), recursive=True)
-
-        for html_file in html_files:
-            # Get relative path from docs directory
-            rel_path = os.path.relpath(html_file, DOCS_DIR)
-
-            # Convert to URL
-            url_path = rel_path.replace(os.sep, '/')
+def generate_sitemap():
+    """Generate the sitemap.xml file."""
 
-            # Determine if this is a language landing page (concepts/{lang}.html)
-            # vs a concept page (concepts/{lang}/{concept}.html)
-            path_parts = rel_path.split(os.sep)
-            is_language_landing = (len(path_parts) == 2 and
-                                 path_parts[0] == 'concepts' and
-                                 path_parts[1].endswith('.html'))
+    print("Generating sitemap.xml...")
 
-            # Create URL entry
-            url = SubElement(urlset, 'url')
-            loc = SubElement(url, 'loc')
-            loc.text = f'{BASE_URL}/{url_path}'
+    # Stream the XML directly instead of building an ElementTree DOM —
+    # the document is purely serial and append-only
+    page_count = 0
+    with open(SITEMAP_FILE, 'w', encoding='utf-8', buffering=1 << 20) as out:
+        out.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        out.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+
+        # Add main index page
+        _write_url_entry(
+            out,
+            f'{BASE_URL}/',
+            get_git_last_modified(os.path.join(DOCS_DIR, 'index.html')),
+            'weekly',
+            '1.0'
+        )
 
-            lastmod = SubElement(url, 'lastmod')
-            lastmod.text = get_git_last_modified(html_file)
+        print(f"Added main index page")
 
-            changefreq = SubElement(url, 'changefreq')
-            changefreq.text = 'weekly' if is_language_landing else 'monthly'
+        # Add all concept pages
+        if os.path.exists(CONCEPTS_DIR):
+            # Find all HTML files in concepts directory
+            for html_file in _iter_html(CONCEPTS_DIR):
+                # Get relative path from docs directory
+                rel_path = os.path.relpath(html_file, DOCS_DIR)
 
-            priority = SubElement(url, 'priority')
-            priority.text = '0.9' if is_language_landing else '0.8'
+                # Convert to URL
+                url_path = rel_path.replace(os.sep, '/')
 
-            page_count += 1
+                # Determine if this is a language landing page (concepts/{lang}.html)
+                # vs a concept page (concepts/{lang}/{concept}.html)
+                is_language_landing = (rel_path.count(os.sep) == 1 and
+                                     rel_path.startswith(_CONCEPTS_PREFIX) and
+                                     rel_path.endswith('.html'))
 
-        print(f"Added {page_count} concept pages")
-    else:
-        print(f"Warning: Concepts directory not found: {CONCEPTS_DIR}")
+                _write_url_entry(
+                    out,
+                    f'{BASE_URL}/{url_path}',
+                    get_git_last_modified(html_file),
+                    'weekly' if is_language_landing else 'monthly',
+                    '0.9' if is_language_landing else '0.8'
+                )
 
-    # Write sitemap to file
-    tree = ElementTree(urlset)
+                page_count += 1
 
-    # Pretty print the XML
-    indent_xml(urlset)
+            print(f"Added {page_count} concept pages")
+        else:
+            print(f"Warning: Concepts directory not found: {CONCEPTS_DIR}")
 
-    tree.write(SITEMAP_FILE, encoding='utf-8', xml_declaration=True)
+        out.write('</urlset>')
 
     print(f"\n✓ Successfully generated sitemap.xml!")
     print(f"  Total URLs: {page_count + 1}")
@@ -121,22 +164,5 @@ def generate_sitemap():
     return page_count + 1
 
 
-def indent_xml(elem, level=0):
-    """Add pretty-printing indentation to XML."""
-    i = "\n" + level * "  "
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = i + "  "
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-        for child in elem:
-            indent_xml(child, level + 1)
-        if not child.tail or not child.tail.strip():
-            child.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
-
-
 if __name__ == '__main__':
     generate_sitemap()
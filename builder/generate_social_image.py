@@ -6,31 +6,40 @@ Generate social preview image (1200×630px) for Open Graph and Twitter Cards.
 from PIL import Image, ImageDraw, ImageFont
 import os
 
-def generate_social_preview():
-    """Generate a 1200×630px social preview image."""
+# Image dimensions (Open Graph standard)
+WIDTH, HEIGHT = 1200, 630
+
+# Colors
+BG_COLOR = '#1e293b'  # Dark slate
+TEXT_COLOR = '#ffffff'  # White
+ACCENT_COLOR = '#60a5fa'  # Blue
+
+# Load fonts once at import, fall back to default if not available
+try:
+    _TITLE_FONT = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 72)
+    _SUBTITLE_FONT = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 36)
+    _LANG_FONT = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf', 24)
+except:
+    # Fallback to default font
+    _TITLE_FONT = ImageFont.load_default()
+    _SUBTITLE_FONT = ImageFont.load_default()
+    _LANG_FONT = ImageFont.load_default()
+
+# Invariant background (title, subtitle, decorative line) rasterized once
+# and copied per output image
+_base_image = None
 
-    # Image dimensions (Open Graph standard)
-    width, height = 1200, 630
 
-    # Colors
-    bg_color = '#1e293b'  # Dark slate
-    text_color = '#ffffff'  # White
-    accent_color = '#60a5fa'  # Blue
+def _build_base_image():
+    """Render the static banner shared by every preview image."""
 
     # Create image
-    img = Image.new('RGB', (width, height), color=bg_color)
+    img = Image.new('RGB', (WIDTH, HEIGHT), color=BG_COLOR)
     draw = ImageDraw.Draw(img)
 
-    # Try to load fonts, fall back to default if not available
-    try:
-        title_font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 72)
-        subtitle_font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 36)
-        lang_font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf', 24)
-    except:
-        # Fallback to default font
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-        lang_font = ImageFont.load_default()
+    title_font = _TITLE_FONT
+    subtitle_font = _SUBTITLE_FONT
+    lang_font = _LANG_FONT
 
     # Title
     title_text = "Programming Language"
@@ -38,55 +47,84 @@ def generate_social_preview():
 
     # Calculate center positions
     # Title line 1
-    bbox = draw.textbbox((0, 0), title_text, font=title_font)
-    title_width = bbox[2] - bbox[0]
-    title_x = (width - title_width) / 2
+    title_width = title_font.getlength(title_text)
+    title_x = (WIDTH - title_width) / 2
     title_y = 150
 
     # Title line 2
-    bbox2 = draw.textbbox((0, 0), title2_text, font=title_font)
-    title2_width = bbox2[2] - bbox2[0]
-    title2_x = (width - title2_width) / 2
+    title2_width = title_font.getlength(title2_text)
+    title2_x = (WIDTH - title2_width) / 2
     title2_y = title_y + 90
 
     # Draw title
-    draw.text((title_x, title_y), title_text, fill=text_color, font=title_font)
-    draw.text((title2_x, title2_y), title2_text, fill=text_color, font=title_font)
+    draw.text((title_x, title_y), title_text, fill=TEXT_COLOR, font=title_font)
+    draw.text((title2_x, title2_y), title2_text, fill=TEXT_COLOR, font=title_font)
 
     # Subtitle
     subtitle_text = "23+ Languages Side by Side"
-    bbox3 = draw.textbbox((0, 0), subtitle_text, font=subtitle_font)
-    subtitle_width = bbox3[2] - bbox3[0]
-    subtitle_x = (width - subtitle_width) / 2
+    subtitle_width = subtitle_font.getlength(subtitle_text)
+    subtitle_x = (WIDTH - subtitle_width) / 2
     subtitle_y = title2_y + 120
 
-    draw.text((subtitle_x, subtitle_y), subtitle_text, fill=accent_color, font=subtitle_font)
+    draw.text((subtitle_x, subtitle_y), subtitle_text, fill=ACCENT_COLOR, font=subtitle_font)
 
-    # Add sample language names
-    languages = ["Python", "JavaScript", "Rust", "Go", "Java"]
-    lang_text = "  •  ".join(languages)
+    # Add decorative line
+    line_y = 100
+    line_margin = 150
+    draw.line([(line_margin, line_y), (WIDTH - line_margin, line_y)], fill=ACCENT_COLOR, width=3)
+
+    # Remember where the language strip goes and which font draws it
+    return img, lang_font, subtitle_y + 70
+
+
+def _get_base_image():
+    """Return the cached base image, rendering it on first use."""
+    global _base_image
+    if _base_image is None:
+        _base_image = _build_base_image()
+    return _base_image
 
-    bbox4 = draw.textbbox((0, 0), lang_text, font=lang_font)
-    lang_width = bbox4[2] - bbox4[0]
-    lang_x = (width - lang_width) / 2
-    lang_y = subtitle_y + 70
 
+def _draw_language_strip(img, lang_font, lang_y, lang_text):
+    """Draw a centered language strip onto a copy-specific image."""
+    draw = ImageDraw.Draw(img)
+    lang_width = lang_font.getlength(lang_text)
+    lang_x = (WIDTH - lang_width) / 2
     draw.text((lang_x, lang_y), lang_text, fill='#94a3b8', font=lang_font)
 
-    # Add decorative line
-    line_y = 100
-    line_margin = 150
-    draw.line([(line_margin, line_y), (width - line_margin, line_y)], fill=accent_color, width=3)
+
+def generate_social_preview():
+    """Generate the default 1200×630px social preview image."""
+
+    base, lang_font, lang_y = _get_base_image()
+    img = base.copy()
+
+    # Add sample language names
+    languages = ["Python", "JavaScript", "Rust", "Go", "Java"]
+    _draw_language_strip(img, lang_font, lang_y, "  •  ".join(languages))
 
     # Save image
     output_path = os.path.join(os.path.dirname(__file__), '..', 'docs', 'social-preview.png')
-    img.save(output_path, 'PNG')
+    img.save(output_path, 'PNG', optimize=False, compress_level=1)
 
     print(f"✓ Social preview image generated: {output_path}")
-    print(f"  Size: {width}×{height}px")
+    print(f"  Size: {WIDTH}×{HEIGHT}px")
     print(f"  Format: PNG")
 
     return output_path
 
+
+def generate_language_preview(language, output_path):
+    """Generate a per-language preview by blitting onto the cached base."""
+
+    base, lang_font, lang_y = _get_base_image()
+    img = base.copy()
+    _draw_language_strip(img, lang_font, lang_y, language)
+
+    img.save(output_path, 'PNG', optimize=False, compress_level=1)
+
+    return output_path
+
+
 if __name__ == '__main__':
     generate_social_preview()
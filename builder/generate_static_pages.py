@@ -18,13 +18,28 @@ Generate static HTML pages for each language-concept combination.
 This creates 2,512 SEO-friendly pages that search engines can index.
 """
 
+import argparse
+import asyncio
+import hashlib
+import io
 import os
 import json
+import tarfile
 import re
+import string
 import subprocess
 import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
 from helper import load_from_yaml, get_safename
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Paths
 DOCS_DIR = os.path.join(os.path.dirname(__file__), '..', 'docs')
 CONTENT_DIR = os.path.join(DOCS_DIR, 'content-autogen', 'gpt_3_5_turbo')
@@ -32,41 +47,122 @@ CONCEPTS_OUTPUT_DIR = os.path.join(DOCS_DIR, 'concepts')
 PROG_LANGS_YAML = os.path.join(DOCS_DIR, 'prog_langs.yaml')
 PROG_CONCEPTS_YAML = os.path.join(DOCS_DIR, 'prog_lang_concepts.yaml')
 
+# Manifest of {language: [json sha256, page count]} from the last run;
+# delete it (or the whole .cache/) to force a full rebuild
+MANIFEST_FILE = os.path.join(os.path.dirname(__file__), '..', '.cache',
+                             'static_pages_manifest.json')
+
 # Base URL for canonical links
 BASE_URL = 'https://prog-lang-compare.netlify.app'
 
+# Slugify as one C-level translate pass: drop punctuation (except the
+# word characters '-' and '_'), turn whitespace into hyphens
+_SLUG_TRANS = str.maketrans(
+    {c: None for c in string.punctuation if c not in '-_'}
+    | {c: '-' for c in string.whitespace}
+)
+
+# Patterns compiled once instead of per call
+_DASH_RUN = re.compile(r'-+')
+_INLINE_CODE = re.compile(r'`([^`]+)`')
+
+# Fences must be extracted before inline code in a separate pass: a
+# combined alternation lets a stray single backtick ahead of a fence eat
+# into the ``` delimiter and changes the rendered output
+_CODE_BLOCK = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
 
+
+@lru_cache(maxsize=None)
 def slugify(text):
     """Convert text to URL-friendly slug."""
-    # Remove special characters and convert to lowercase
-    slug = re.sub(r'[^\w\s-]', '', text.lower())
-    # Replace whitespace with hyphens
-    slug = re.sub(r'[-\s]+', '-', slug)
-    return slug.strip('-')
+    slug = text.lower().translate(_SLUG_TRANS)
+    # Collapse hyphen runs left by adjacent separators
+    return _DASH_RUN.sub('-', slug).strip('-')
 
 
-def get_last_modified_date(file_path):
-    """Get last modified date from git history or filesystem."""
+# Lazily built {repo-relative path: YYYY-MM-DD} index from a single git log walk
+_git_date_index = None
+
+
+def _build_git_mtime_index():
+    """Build a {path: last modified date} index with one git log call.
+
+    A single full-history walk (newest commit first) replaces the
+    per-page git subprocess; each file gets the date of the most recent
+    commit that touched it.
+    """
+    index = {}
     try:
-        # Try to get date from git
         result = subprocess.run(
-            ['git', 'log', '-1', '--format=%cI', file_path],
+            ['git', 'log', '--name-only', '--format=%x00%cI', 'HEAD'],
             capture_output=True,
             text=True,
             cwd=os.path.dirname(__file__)
         )
-        if result.returncode == 0 and result.stdout.strip():
-            # Extract date part (YYYY-MM-DD)
-            return result.stdout.strip().split('T')[0]
+        if result.returncode == 0 and result.stdout:
+            # Each commit block starts with a NUL byte followed by its ISO date
+            for block in result.stdout.split('\x00'):
+                lines = block.splitlines()
+                if not lines:
+                    continue
+                # Extract date part (YYYY-MM-DD)
+                date_str = lines[0].split('T')[0]
+                for path in lines[1:]:
+                    if path and path not in index:
+                        index[path] = date_str
     except:
         pass
 
-    # Fallback to file modification time
+    return index
+
+
+# Lazily built {filename: YYYY-MM-DD} map from one scan of CONTENT_DIR,
+# used when the git index has no entry for a content file
+_content_mtimes = None
+
+
+def _scan_content_mtimes():
+    """Batch-stat every content JSON with a single directory scan."""
+    mtimes = {}
     try:
-        if os.path.exists(file_path):
-            mtime = os.path.getmtime(file_path)
-            return datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
-    except:
+        with os.scandir(CONTENT_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json'):
+                    mtimes[entry.name] = datetime.datetime.fromtimestamp(
+                        entry.stat().st_mtime).strftime('%Y-%m-%d')
+    except OSError:
+        pass
+    return mtimes
+
+
+def get_last_modified_date(file_path):
+    """Get last modified date from git history or filesystem."""
+    global _git_date_index, _content_mtimes
+    if _git_date_index is None:
+        _git_date_index = _build_git_mtime_index()
+
+    # git log prints paths relative to the repo root with forward slashes
+    repo_root = os.path.join(os.path.dirname(__file__), '..')
+    rel_path = os.path.relpath(file_path, repo_root).replace(os.sep, '/')
+
+    date_str = _git_date_index.get(rel_path)
+    if date_str:
+        return date_str
+
+    # Fallback to the batch-scanned content mtimes
+    if _content_mtimes is None:
+        _content_mtimes = _scan_content_mtimes()
+
+    date_str = _content_mtimes.get(os.path.basename(file_path))
+    if date_str:
+        return date_str
+
+    # Fallback to file modification time (getmtime raises if missing,
+    # so no separate exists check)
+    try:
+        mtime = os.path.getmtime(file_path)
+        return datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
+    except OSError:
         pass
 
     # Final fallback
@@ -81,24 +177,15 @@ def markdown_to_html(markdown_text):
     if not markdown_text:
         return ""
 
-    # Escape HTML special characters first
-    html = markdown_text
-
     # Convert code blocks (```)
-    html = re.sub(
-        r'```(\w*)\n(.*?)```',
-        r'<pre><code class="language-\1">\2</code></pre>',
-        html,
-        flags=re.DOTALL
-    )
+    html = _CODE_BLOCK.sub(r'<pre><code class="language-\1">\2</code></pre>', markdown_text)
 
     # Convert inline code (`)
-    html = re.sub(r'`([^`]+)`', r'<code>\1</code>', html)
+    html = _INLINE_CODE.sub(r'<code>\1</code>', html)
 
-    # Convert paragraphs
-    paragraphs = html.split('\n\n')
+    # Convert paragraphs in one linear emit
     html_paragraphs = []
-    for para in paragraphs:
+    for para in html.split('\n\n'):
         para = para.strip()
         if para.startswith('<pre>'):
             html_paragraphs.append(para)
@@ -107,234 +194,177 @@ def markdown_to_html(markdown_text):
             para = para.replace('\n', '<br>\n')
             html_paragraphs.append(f'<p>{para}</p>')
 
-    html = '\n'.join(html_paragraphs)
-
-    return html
-
-
-def generate_related_languages_section(current_language, concept_slug, all_languages):
-    """Generate HTML section showing this concept in other languages."""
-    if not all_languages:
-        return ""
-
-    # Filter out current language
-    other_languages = [lang for lang in all_languages if lang != current_language]
-
-    if not other_languages:
-        return ""
-
-    # Generate language links
-    language_links = []
-    for lang in other_languages:
-        lang_slug = slugify(lang)
-        lang_display = lang.replace('_', ' ')
-        language_links.append(
-            f'<a href="../{lang_slug}/{concept_slug}.html">{lang_display}</a>'
-        )
-
-    links_html = ''.join(language_links)
-
-    return f"""
-            <section class="related-concepts" style="margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee;">
-                <h2 style="font-size: 20px; margin-bottom: 15px; color: #2c3e50;">See this concept in other languages</h2>
-                <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(150px, 1fr)); gap: 10px;">
-                    {links_html}
-                </div>
-                <style>
-                    .related-concepts a {{
-                        padding: 8px 12px;
-                        background: #f5f5f5;
-                        border-radius: 4px;
-                        text-decoration: none;
-                        color: #0066cc;
-                        display: inline-block;
-                        text-align: center;
-                        transition: background 0.2s, transform 0.2s;
-                    }}
-                    .related-concepts a:hover {{
-                        background: #e5e7eb;
-                        transform: translateY(-2px);
-                    }}
-                </style>
-            </section>
-"""
-
-
-def generate_page_template(language, concept_key, concept_title, content_html, category, all_languages=None):
-    """Generate HTML template for a concept page."""
-
-    # Parse concept key to get readable title
-    parts = concept_key.split('_')
-    if len(parts) > 1:
-        subconcept = ' '.join(parts[1:]).replace('_', ' ')
-        full_title = f"{subconcept} in {language}"
-    else:
-        full_title = f"{concept_title} in {language}"
-
-    # Generate description
-    description = f"Learn how to {subconcept.lower()} in {language}. See code examples and detailed explanations." if len(parts) > 1 else f"Programming concept {concept_title} in {language} with examples."
-
-    # Clean language name for display
-    language_display = language.replace('_', ' ')
-
-    # URL paths
-    concept_slug = slugify(concept_key)
-    language_slug = slugify(language)
-    page_url = f"{BASE_URL}/concepts/{language_slug}/{concept_slug}.html"
-
-    # Get last modified date from git or filesystem
-    safe_lang_name = get_safename(language)
-    json_file = os.path.join(CONTENT_DIR, f"{safe_lang_name}.json")
-    date_modified = get_last_modified_date(json_file)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    return '\n'.join(html_paragraphs)
 
-    <!-- Primary Meta Tags -->
-    <title>{full_title} - Prog Lang Compare</title>
-    <meta name="title" content="{full_title} - Prog Lang Compare">
-    <meta name="description" content="{description}">
-    <meta name="keywords" content="{language}, {concept_title}, programming, code examples, syntax, {category}">
-
-    <!-- Open Graph / Facebook -->
-    <meta property="og:type" content="article">
-    <meta property="og:url" content="{page_url}">
-    <meta property="og:title" content="{full_title}">
-    <meta property="og:description" content="{description}">
-    <meta property="og:image" content="{BASE_URL}/social-preview.png">
-
-    <!-- Twitter -->
-    <meta property="twitter:card" content="summary_large_image">
-    <meta property="twitter:url" content="{page_url}">
-    <meta property="twitter:title" content="{full_title}">
-    <meta property="twitter:description" content="{description}">
-    <meta property="twitter:image" content="{BASE_URL}/social-preview.png">
 
-    <!-- Canonical URL -->
-    <link rel="canonical" href="{page_url}">
-
-    <!-- Favicon -->
-    <link rel="icon" type="image/svg+xml" href="../../favicon.svg">
-
-    <!-- Inline Critical CSS -->
-    <style>
-        * {{
+# Shared per-page CSS, written once to docs/concepts/style.css
+_PAGE_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             line-height: 1.6;
             color: #333;
             background-color: #f9f9f9;
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 900px;
             margin: 0 auto;
             background: white;
             padding: 30px;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
+        }
 
-        nav.breadcrumb {{
+        nav.breadcrumb {
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 1px solid #eee;
             font-size: 14px;
-        }}
+        }
 
-        nav.breadcrumb a {{
+        nav.breadcrumb a {
             color: #0066cc;
             text-decoration: none;
-        }}
+        }
 
-        nav.breadcrumb a:hover {{
+        nav.breadcrumb a:hover {
             text-decoration: underline;
-        }}
+        }
 
-        nav.breadcrumb span {{
+        nav.breadcrumb span {
             color: #666;
             margin: 0 5px;
-        }}
+        }
 
-        h1 {{
+        h1 {
             color: #2c3e50;
             margin-bottom: 10px;
             font-size: 28px;
-        }}
+        }
 
-        .meta {{
+        .meta {
             color: #666;
             font-size: 14px;
             margin-bottom: 30px;
             padding: 10px;
             background-color: #f5f5f5;
             border-left: 4px solid #0066cc;
-        }}
+        }
 
-        .content {{
+        .content {
             margin-top: 20px;
-        }}
+        }
 
-        .content p {{
+        .content p {
             margin-bottom: 15px;
-        }}
+        }
 
-        .content pre {{
+        .content pre {
             background-color: #f4f4f4;
             padding: 15px;
             border-radius: 5px;
             overflow-x: auto;
             margin: 15px 0;
             border: 1px solid #ddd;
-        }}
+        }
 
-        .content code {{
+        .content code {
             background-color: #f4f4f4;
             padding: 2px 6px;
             border-radius: 3px;
             font-family: 'Courier New', Courier, monospace;
             font-size: 14px;
-        }}
+        }
 
-        .content pre code {{
+        .content pre code {
             background-color: transparent;
             padding: 0;
-        }}
+        }
 
-        .back-link {{
+        .back-link {
             margin-top: 40px;
             padding-top: 20px;
             border-top: 1px solid #eee;
-        }}
+        }
 
-        .back-link a {{
+        .back-link a {
             color: #0066cc;
             text-decoration: none;
             font-weight: 500;
-        }}
+        }
 
-        .back-link a:hover {{
+        .back-link a:hover {
             text-decoration: underline;
-        }}
+        }
 
-        footer {{
+        footer {
             margin-top: 40px;
             padding-top: 20px;
             border-top: 1px solid #eee;
             text-align: center;
             color: #666;
             font-size: 14px;
-        }}
-    </style>
+        }
+
+            .related-concepts a {
+                padding: 8px 12px;
+                background: #f5f5f5;
+                border-radius: 4px;
+                text-decoration: none;
+                color: #0066cc;
+                display: inline-block;
+                text-align: center;
+                transition: background 0.2s, transform 0.2s;
+            }
+            .related-concepts a:hover {
+                background: #e5e7eb;
+                transform: translateY(-2px);
+            }
+"""
+
+
+# Page shell shared by every concept page, rendered via str.format_map.
+# Literal CSS/JSON-LD braces are escaped ({{ }}).
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+
+    <!-- Primary Meta Tags -->
+    <title>{full_title} - Prog Lang Compare</title>
+    <meta name="title" content="{full_title} - Prog Lang Compare">
+    <meta name="description" content="{description}">
+    <meta name="keywords" content="{language}, {concept_title}, programming, code examples, syntax, {category}">
+
+    <!-- Open Graph / Facebook -->
+    <meta property="og:type" content="article">
+    <meta property="og:url" content="{page_url}">
+    <meta property="og:title" content="{full_title}">
+    <meta property="og:description" content="{description}">
+    <meta property="og:image" content="{BASE_URL}/social-preview.png">
+
+    <!-- Twitter -->
+    <meta property="twitter:card" content="summary_large_image">
+    <meta property="twitter:url" content="{page_url}">
+    <meta property="twitter:title" content="{full_title}">
+    <meta property="twitter:description" content="{description}">
+    <meta property="twitter:image" content="{BASE_URL}/social-preview.png">
+
+    <!-- Canonical URL -->
+    <link rel="canonical" href="{page_url}">
+
+    <!-- Favicon -->
+    <link rel="icon" type="image/svg+xml" href="../../favicon.svg">
+
+    <!-- Shared stylesheet -->
+    <link rel="stylesheet" href="../style.css">
 
     <!-- Structured Data -->
     <script type="application/ld+json">
@@ -387,7 +417,7 @@ def generate_page_template(language, concept_key, concept_title, content_html, c
                 {content_html}
             </article>
 
-            {generate_related_languages_section(language, concept_slug, all_languages) if all_languages else ""}
+            {related_section}
 
             <div class="back-link">
                 <a href="../../index.html">← Back to Full Comparison Table</a>
@@ -401,24 +431,254 @@ def generate_page_template(language, concept_key, concept_title, content_html, c
 </body>
 </html>"""
 
+
+# Constant wrapper for the related-languages section; only the links vary
+_RELATED_TEMPLATE = """
+            <section class="related-concepts" style="margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee;">
+                <h2 style="font-size: 20px; margin-bottom: 15px; color: #2c3e50;">See this concept in other languages</h2>
+                <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(150px, 1fr)); gap: 10px;">
+                    {links_html}
+                </div>
+
+            </section>
+"""
+
+
+# concept_slug -> [(language, anchor html)] across all languages; each page
+# drops only its own entry, so the anchors are assembled once per concept
+_related_links_cache = {}
+
+
+def generate_related_languages_section(current_language, concept_slug, all_languages):
+    """Generate HTML section showing this concept in other languages."""
+    links = _related_links_cache.get(concept_slug)
+    if links is None:
+        links = [
+            (lang, f'<a href="../{slugify(lang)}/{concept_slug}.html">{lang.replace("_", " ")}</a>')
+            for lang in all_languages
+        ]
+        _related_links_cache[concept_slug] = links
+
+    # Skip the current language's own anchor
+    links_html = ''.join(anchor for lang, anchor in links if lang != current_language)
+
+    if not links_html:
+        return ""
+
+    return _RELATED_TEMPLATE.format_map({'links_html': links_html})
+
+
+@lru_cache(maxsize=None)
+def _concept_meta(concept_key):
+    """Per-concept strings reused verbatim across every language."""
+    concept_slug = slugify(concept_key)
+    concept_title = concept_key.replace('_', ' ')
+    parts = concept_key.split('_')
+    if len(parts) > 1:
+        subconcept = ' '.join(parts[1:]).replace('_', ' ')
+        sub_lower = subconcept.lower()
+    else:
+        subconcept = sub_lower = None
+    return concept_slug, concept_title, subconcept, sub_lower
+
+
+def generate_page_template(language, concept_key, content_html, category,
+                           language_slug, language_display, date_modified,
+                           all_languages):
+    """Generate HTML template for a concept page.
+
+    The per-language values (slug, display name, modification date) are
+    computed once per language by the caller; the per-concept strings come
+    from the memoized _concept_meta.
+    """
+    concept_slug, concept_title, subconcept, sub_lower = _concept_meta(concept_key)
+
+    # Readable title and description
+    if subconcept is not None:
+        full_title = f"{subconcept} in {language}"
+        description = f"Learn how to {sub_lower} in {language}. See code examples and detailed explanations."
+    else:
+        full_title = f"{concept_title} in {language}"
+        description = f"Programming concept {concept_title} in {language} with examples."
+
+    # URL paths
+    page_url = f"{BASE_URL}/concepts/{language_slug}/{concept_slug}.html"
+
+    related_section = generate_related_languages_section(language, concept_slug, all_languages)
+
+    html = _PAGE_TEMPLATE.format_map({
+        'full_title': full_title,
+        'description': description,
+        'language': language,
+        'language_display': language_display,
+        'language_slug': language_slug,
+        'concept_title': concept_title,
+        'category': category,
+        'page_url': page_url,
+        'date_modified': date_modified,
+        'content_html': content_html,
+        'related_section': related_section,
+        'BASE_URL': BASE_URL,
+    })
+
     return html
 
 
+# concept_key -> category, filled on first resolution; the answer is a pure
+# function of the concepts YAML and identical for every language
+_category_cache = {}
+
+
 def get_category_for_concept(concept_key, concepts_data):
     """Find which category a concept belongs to."""
-    # Remove the 'title' key if it exists
-    concepts = {k: v for k, v in concepts_data.items() if k != 'title'}
+    cached = _category_cache.get(concept_key)
+    if cached is not None:
+        return cached
 
-    for category, subconcepts in concepts.items():
+    # Skip the 'title' key in place rather than copying the dict per miss
+    for category, subconcepts in concepts_data.items():
+        if category == 'title':
+            continue
         if subconcepts and isinstance(subconcepts, dict):
             for subconcept_key in subconcepts.keys():
                 # Create the composite key
                 composite_key = f"{category}_{subconcept_key.replace(' ', '_').replace('?', '_').replace('/', '_')}"
                 if composite_key == concept_key or subconcept_key.replace(' ', '_') in concept_key:
+                    _category_cache[concept_key] = category
                     return category
 
     # Default to extracting category from concept_key
-    return concept_key.split('_')[0] if '_' in concept_key else 'General'
+    category = concept_key.split('_')[0] if '_' in concept_key else 'General'
+    _category_cache[concept_key] = category
+    return category
+
+
+def _write_page(output_file, page_bytes):
+    """Save one page with a single low-level write, skipping the
+    buffered file-object layer entirely."""
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, page_bytes)
+    finally:
+        os.close(fd)
+
+
+async def _render_pages(content, language, concepts_data, languages,
+                        language_slug, language_display, date_modified,
+                        lang_dir, sink=None):
+    """Assemble pages on the event loop while writer threads drain the
+    disk writes, overlapping template work with open/write latency.
+
+    When sink is a list, pages are appended to it as
+    (relative path, bytes) pairs instead of being written to disk.
+    """
+    writes = []
+    for concept_key, markdown_content in content.items():
+        concept_slug = slugify(concept_key)
+
+        # Get category
+        category = get_category_for_concept(concept_key, concepts_data)
+
+        # Convert markdown to HTML
+        content_html = markdown_to_html(markdown_content)
+
+        # Generate HTML page
+        html = generate_page_template(
+            language=language,
+            concept_key=concept_key,
+            content_html=content_html,
+            category=category,
+            language_slug=language_slug,
+            language_display=language_display,
+            date_modified=date_modified,
+            all_languages=languages
+        )
+
+        if sink is not None:
+            sink.append((f"{language_slug}/{concept_slug}.html", html.encode('utf-8')))
+            continue
+
+        # Hand the encoded page to a writer thread and keep assembling;
+        # the sleep(0) yields to the event loop so the task is started
+        # (and its write begins) before the next page is assembled
+        output_file = os.path.join(lang_dir, f"{concept_slug}.html")
+        writes.append(asyncio.create_task(
+            asyncio.to_thread(_write_page, output_file, html.encode('utf-8'))
+        ))
+        await asyncio.sleep(0)
+
+    if writes:
+        await asyncio.gather(*writes)
+
+
+def render_language(language, json_file, concepts_data, languages,
+                    git_date_index=None, collect=False):
+    """Worker: render every concept page for one language.
+
+    Runs in its own process; the parent passes the prebuilt git date
+    index so workers never shell out to git themselves. With
+    collect=True the pages are returned as (relative path, bytes)
+    pairs instead of being written to disk.
+    """
+    global _git_date_index
+    if git_date_index is not None:
+        _git_date_index = git_date_index
+
+    # Load language content with one large read; orjson decodes the big
+    # markdown values in C when installed
+    content = _loads(Path(json_file).read_bytes())
+
+    # Per-language invariants, computed once outside the concept loop
+    language_slug = slugify(language)
+    language_display = language.replace('_', ' ')
+    date_modified = get_last_modified_date(json_file)
+
+    # Create language directory
+    lang_dir = os.path.join(CONCEPTS_OUTPUT_DIR, language_slug)
+    if not collect:
+        os.makedirs(lang_dir, exist_ok=True)
+
+    # Generate page for each concept
+    sink = [] if collect else None
+    asyncio.run(_render_pages(
+        content, language, concepts_data, languages,
+        language_slug, language_display, date_modified, lang_dir, sink
+    ))
+
+    return sink if collect else len(content)
+
+
+def _manifest_salt():
+    """Hash of everything pages depend on besides their language JSON.
+
+    Covers this builder module (templates and render code live here),
+    the concepts YAML and the language list (related-links section), so
+    changing any of them invalidates every manifest entry.
+    """
+    digest = hashlib.sha256()
+    for path in (os.path.abspath(__file__), PROG_CONCEPTS_YAML, PROG_LANGS_YAML):
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def _load_manifest(salt):
+    """Load the persisted {language: [json sha256, page count]} map,
+    discarding it when the salt no longer matches."""
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('salt') != salt:
+        return {}
+    return manifest.get('languages', {})
+
+
+def _save_manifest(salt, languages):
+    """Persist the source-hash manifest for the next run."""
+    os.makedirs(os.path.dirname(MANIFEST_FILE), exist_ok=True)
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'salt': salt, 'languages': languages}, f)
 
 
 def generate_all_pages():
@@ -435,60 +695,137 @@ def generate_all_pages():
 
     total_pages = 0
 
-    # Process each language
-    for language in languages:
-        safe_lang_name = get_safename(language)
-        json_file = os.path.join(CONTENT_DIR, f"{safe_lang_name}.json")
-
-        if not os.path.exists(json_file):
-            print(f"Warning: JSON file not found for {language}: {json_file}")
-            continue
+    # Write the shared stylesheet once; every page links to it instead of
+    # carrying ~4 KB of inline CSS
+    os.makedirs(CONCEPTS_OUTPUT_DIR, exist_ok=True)
+    with open(os.path.join(CONCEPTS_OUTPUT_DIR, 'style.css'), 'w', encoding='utf-8') as f:
+        f.write(_PAGE_CSS)
+
+    # Resolve git dates once in the parent so every worker reuses the index
+    global _git_date_index
+    if _git_date_index is None:
+        _git_date_index = _build_git_mtime_index()
+
+    # Pages are a pure function of the language JSON plus the salted
+    # shared inputs, so a matching hash from the last run means
+    # identical output on disk
+    salt = _manifest_salt()
+    manifest = _load_manifest(salt)
+    new_manifest = {}
+    skipped = 0
+
+    # Each language's pages are a pure function of read-only inputs, so
+    # shard the render across processes
+    with ProcessPoolExecutor() as executor:
+        futures = {}
+        for language in languages:
+            safe_lang_name = get_safename(language)
+            json_file = os.path.join(CONTENT_DIR, f"{safe_lang_name}.json")
+
+            if not os.path.exists(json_file):
+                print(f"Warning: JSON file not found for {language}: {json_file}")
+                continue
+
+            json_hash = hashlib.sha256(Path(json_file).read_bytes()).hexdigest()
+            previous = manifest.get(language)
+            if previous and previous[0] == json_hash:
+                new_manifest[language] = previous
+                total_pages += previous[1]
+                skipped += 1
+                continue
+
+            future = executor.submit(
+                render_language, language, json_file,
+                concepts_data, languages, _git_date_index
+            )
+            futures[future] = (language, json_hash)
 
-        print(f"\nProcessing {language}...")
+        for future in as_completed(futures):
+            language, json_hash = futures[future]
+            page_count = future.result()
+            print(f"  Generated {page_count} pages for {language}")
+            new_manifest[language] = [json_hash, page_count]
+            total_pages += page_count
 
-        # Load language content
-        with open(json_file, 'r', encoding='utf-8') as f:
-            content = json.load(f)
+    _save_manifest(salt, new_manifest)
+    if skipped:
+        print(f"  Skipped {skipped} unchanged languages")
 
-        # Create language directory
-        language_slug = slugify(language)
-        lang_dir = os.path.join(CONCEPTS_OUTPUT_DIR, language_slug)
-        os.makedirs(lang_dir, exist_ok=True)
+    print(f"\n✓ Successfully generated {total_pages} static HTML pages!")
+    print(f"  Output directory: {CONCEPTS_OUTPUT_DIR}")
 
-        # Generate page for each concept
-        for concept_key, markdown_content in content.items():
-            concept_slug = slugify(concept_key)
+    return total_pages
 
-            # Get category
-            category = get_category_for_concept(concept_key, concepts_data)
 
-            # Convert markdown to HTML
-            content_html = markdown_to_html(markdown_content)
+def generate_archive(archive_path):
+    """Render every page straight into a single tar archive.
 
-            # Generate HTML page
-            html = generate_page_template(
-                language=language,
-                concept_key=concept_key,
-                concept_title=concept_key.replace('_', ' '),
-                content_html=content_html,
-                category=category,
-                all_languages=languages
-            )
+    Writing one sequential stream avoids the per-file filesystem
+    overhead of 2,500+ small files, which is the fast path when the
+    output is destined for CI artifacts or an object-store upload.
+    """
+    print("Loading configurations...")
+    languages_data = load_from_yaml(PROG_LANGS_YAML)
+    concepts_data = load_from_yaml(PROG_CONCEPTS_YAML)
 
-            # Save page
-            output_file = os.path.join(lang_dir, f"{concept_slug}.html")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html)
+    languages = languages_data.get('Programming Languages', [])
 
-            total_pages += 1
+    print(f"Found {len(languages)} languages")
+    print(f"Writing archive: {archive_path}")
 
-        print(f"  Generated {len(content)} pages for {language}")
+    global _git_date_index
+    if _git_date_index is None:
+        _git_date_index = _build_git_mtime_index()
 
-    print(f"\n✓ Successfully generated {total_pages} static HTML pages!")
-    print(f"  Output directory: {CONCEPTS_OUTPUT_DIR}")
+    total_pages = 0
+    with tarfile.open(archive_path, 'w') as tf:
+        # The shared stylesheet the pages link to
+        css_bytes = _PAGE_CSS.encode('utf-8')
+        info = tarfile.TarInfo(name='style.css')
+        info.size = len(css_bytes)
+        tf.addfile(info, io.BytesIO(css_bytes))
+
+        # Workers render and return page bytes; the parent owns the
+        # single sequential tar stream
+        with ProcessPoolExecutor() as executor:
+            futures = {}
+            for language in languages:
+                safe_lang_name = get_safename(language)
+                json_file = os.path.join(CONTENT_DIR, f"{safe_lang_name}.json")
+
+                if not os.path.exists(json_file):
+                    print(f"Warning: JSON file not found for {language}: {json_file}")
+                    continue
+
+                future = executor.submit(
+                    render_language, language, json_file,
+                    concepts_data, languages, _git_date_index, True
+                )
+                futures[future] = language
+
+            for future in as_completed(futures):
+                language = futures[future]
+                pages = future.result()
+                for rel_path, page_bytes in pages:
+                    info = tarfile.TarInfo(name=rel_path)
+                    info.size = len(page_bytes)
+                    tf.addfile(info, io.BytesIO(page_bytes))
+                print(f"  Archived {len(pages)} pages for {language}")
+                total_pages += len(pages)
+
+    print(f"\n✓ Successfully archived {total_pages} static HTML pages!")
+    print(f"  Archive: {archive_path}")
 
     return total_pages
 
 
 if __name__ == '__main__':
-    generate_all_pages()
+    parser = argparse.ArgumentParser(description='Generate static concept pages')
+    parser.add_argument('--archive', metavar='PATH',
+                        help='write pages into a single tar archive instead of docs/concepts/')
+    args = parser.parse_args()
+
+    if args.archive:
+        generate_archive(args.archive)
+    else:
+        generate_all_pages()
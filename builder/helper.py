@@ -1,18 +1,55 @@
+import functools
+import hashlib
+import json
 import os
 import yaml
 
+# Prefer the libyaml C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 def load_from_yaml(yaml_file):
     '''
     Loads the yaml file containing the language concepts
     '''
     with open(yaml_file, 'r', encoding='utf-8') as stream:
         try:
-            content = yaml.safe_load(stream)
+            content = yaml.load(stream, Loader=_YamlLoader)
             # print(lang_concepts)
         except yaml.YAMLError as exc:
             print(exc)
+            raise
     return content
 
+# Digest of the last payload written per path, so a no-op save costs an
+# in-memory serialize + hash instead of a disk write
+_last_write_digests = {}
+
+def _skip_unchanged_write(filepath, payload):
+    '''
+    Returns True when the payload matches the last write to this path
+    '''
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if _last_write_digests.get(filepath) == digest and os.path.exists(filepath):
+        return True
+    _last_write_digests[filepath] = digest
+    return False
+
+def _write_atomic(filepath, payload):
+    '''
+    Writes the payload with one syscall to a temp file, then renames it
+    into place so readers never see a partial file
+    '''
+    tmp_path = filepath + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, filepath)
+
 def save_to_yaml(filepath, content):
     #save yaml file
      # Create the directory if it does not exist
@@ -20,10 +57,37 @@ def save_to_yaml(filepath, content):
     if not os.path.exists(directory):
         os.makedirs(directory)
 
-    with open(filepath, 'w', encoding='utf-8') as outfile:
-        yaml.dump(content, outfile, default_flow_style=False)
+    payload = yaml.dump(content, Dumper=_YamlDumper, default_flow_style=False).encode('utf-8')
+    if _skip_unchanged_write(filepath, payload):
+        return
+
+    _write_atomic(filepath, payload)
+
+
+def load_from_json(json_file):
+    '''
+    Loads a machine-written json file (e.g. the .cache files)
+    '''
+    with open(json_file, 'r', encoding='utf-8') as stream:
+        return json.load(stream)
+
+def save_to_json(filepath, content):
+    #save json file
+     # Create the directory if it does not exist
+    directory = os.path.dirname(filepath)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    payload = json.dumps(content).encode('utf-8')
+    if _skip_unchanged_write(filepath, payload):
+        return
+
+    _write_atomic(filepath, payload)
 
 
+# The same handful of language names are mangled over and over during a
+# build, so memoize the result per input string
+@functools.lru_cache(maxsize=256)
 def get_safename(value):
     # Special case mappings for languages with problematic characters
     special_mappings = {
@@ -1,28 +1,143 @@
+import atexit
 import os
+import sys
 import helper
 
 cache ={}
 lang_concepts = {}
 
+# Cache root — overridable (e.g. by tests) instead of chdir-ing around it
+CACHE_DIR = '.cache'
+
+# {(cache root, language): file path} so the safename + join work runs
+# once per language instead of on every flush
+_path_cache = {}
+
+
+def _cache_path(proglang):
+    key = (CACHE_DIR, proglang)
+    path = _path_cache.get(key)
+    if path is None:
+        path = _path_cache.setdefault(
+            key, os.path.join(CACHE_DIR, helper.get_safename(proglang) + '.json'))
+    return path
+
+# {path: ((mtime_ns, size), parsed content)} so reloading an unchanged
+# cache file costs one os.stat instead of a full reparse
+_last_loaded = {}
+
+# Shared empty dict so missing keys chain through .get without raising
+_EMPTY = {}
+
+# Flat {(concept, subconcept): prompt} views of the nested trees, built
+# by load() so the hot is_cache_exist path does one probe per tree
+# instead of two. Only valid while the module globals still point at
+# the trees they were built from; _flat_src tracks that.
+_flat_cache = {}
+_flat_lang = {}
+_flat_src = (None, None)
+
+
+def _flatten(tree):
+    flat = {}
+    if tree:
+        for concept, subconcepts in tree.items():
+            if isinstance(subconcepts, dict):
+                for subconcept, prompt in subconcepts.items():
+                    flat[(concept, subconcept)] = prompt
+    return flat
+
+
+def _reindex():
+    global _flat_cache
+    global _flat_lang
+    global _flat_src
+    _flat_cache = _flatten(cache)
+    _flat_lang = _flatten(lang_concepts)
+    _flat_src = (cache, lang_concepts)
+
+
 def is_cache_exist(prog_lang, concept, subconcept):
     '''
     Checks if the prompt is new or not
     '''
-    
-    is_exist = False
 
-    try:
-        if lang_concepts[concept][subconcept] == cache[concept][subconcept]:
-            is_exist = True
-    except (ValueError, TypeError, KeyError):
-        is_exist = False
-    
-    return is_exist
+    if _flat_src[0] is cache and _flat_src[1] is lang_concepts:
+        key = (concept, subconcept)
+        prompt = _flat_lang.get(key)
+        cached = _flat_cache.get(key)
+    else:
+        # The trees were assigned directly (e.g. by tests) — fall back
+        # to the nested view
+        prompt = (lang_concepts or _EMPTY).get(concept, _EMPTY).get(subconcept)
+        cached = (cache or _EMPTY).get(concept, _EMPTY).get(subconcept)
+
+    # Interned prompts make the identity check succeed without a full
+    # string comparison; == is the fallback for uninterned values
+    return prompt is not None and (prompt is cached or prompt == cached)
+
+
+def _intern_tree(tree):
+    '''
+    Rebuilds the nested tree with interned keys and prompt strings, so
+    the cache and lang_concepts trees share one object per repeated
+    string and key hashing in the hot lookups is a pointer compare
+    '''
+    if not tree:
+        return tree
+
+    interned = {}
+    for concept, subconcepts in tree.items():
+        if isinstance(subconcepts, dict):
+            subconcepts = {
+                sys.intern(key): sys.intern(prompt) if isinstance(prompt, str) else prompt
+                for key, prompt in subconcepts.items()
+            }
+        if isinstance(concept, str):
+            concept = sys.intern(concept)
+        interned[concept] = subconcepts
+    return interned
 
 # def update()
 
+# Deferred-flush state: update() only mutates the in-memory cache and
+# the files are rewritten every FLUSH_EVERY updates and at exit,
+# instead of re-serializing the whole dict per subconcept. Updates
+# interleave across languages (main.py fans them out from a thread
+# pool), so every touched language is tracked and flushed.
+FLUSH_EVERY = 16
+_dirty_langs = set()
+_updates_since_flush = 0
+
+
+def flush(prog_lang=None):
+    '''
+    Writes the in-memory cache to disk for the given language, or for
+    every language with unsaved updates
+    '''
+    global _updates_since_flush
+
+    if prog_lang is not None:
+        langs = [prog_lang] if prog_lang in _dirty_langs else []
+    else:
+        langs = list(_dirty_langs)
+
+    for lang in langs:
+        # json is much cheaper to serialize than yaml and the cache
+        # files are machine-written only
+        helper.save_to_json(_cache_path(lang), cache)
+        _dirty_langs.discard(lang)
+
+    if not _dirty_langs:
+        _updates_since_flush = 0
+
+
+atexit.register(flush)
+
+
 def update( prog_lang, concept, subconcept):
     global cache
+    global _updates_since_flush
     subconcept_proglang = f'{subconcept}-proglangs'
     mycache = {} if cache is None else cache
     mycache[concept] = {} if concept not in mycache.keys() else mycache[concept]
@@ -31,20 +146,47 @@ def update( prog_lang, concept, subconcept):
 
     cache = mycache
 
-    filepath = f'.cache/{helper.get_safename(prog_lang)}.yaml'
-    helper.save_to_yaml(filepath, cache)
+    # Keep the flat view in sync when it still mirrors this tree
+    if _flat_src[0] is cache:
+        _flat_cache[(concept, subconcept)] = mycache[concept][subconcept]
+
+    _dirty_langs.add(prog_lang)
+    _updates_since_flush += 1
+    if _updates_since_flush >= FLUSH_EVERY:
+        flush()
 
 
 
 def load(lang_concepts_yaml,proglang):
-    proglang_filename = helper.get_safename(proglang)
-    proglang_filepath = f'.cache/{proglang_filename}.yaml'
-    cache_yaml = helper.load_from_yaml(proglang_filepath) if os.path.exists(proglang_filepath) else None
+    # Persist any pending updates for the previous language before the
+    # in-memory cache is replaced
+    flush()
+
+    proglang_filepath = _cache_path(proglang)
+    legacy_filepath = os.path.join(CACHE_DIR, f'{helper.get_safename(proglang)}.yaml')
+
+    if os.path.exists(proglang_filepath):
+        stat = os.stat(proglang_filepath)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        last = _last_loaded.get(proglang_filepath)
+        if last is not None and last[0] == file_key:
+            cache_content = last[1]
+        else:
+            cache_content = helper.load_from_json(proglang_filepath)
+            _last_loaded[proglang_filepath] = (file_key, cache_content)
+    elif os.path.exists(legacy_filepath):
+        # One-shot migration of a pre-json cache file
+        cache_content = helper.load_from_yaml(legacy_filepath)
+        helper.save_to_json(proglang_filepath, cache_content)
+        os.remove(legacy_filepath)
+    else:
+        cache_content = None
 
     global cache
     global lang_concepts
-    cache = cache_yaml
-    lang_concepts = lang_concepts_yaml
+    cache = _intern_tree(cache_content)
+    lang_concepts = _intern_tree(lang_concepts_yaml)
+    _reindex()
 
 # def save():
 #     '''
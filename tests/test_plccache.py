@@ -11,28 +11,47 @@ import plccache
 import helper
 
 
+def _make_scratch_dir():
+    """Create a test scratch dir, preferring the /dev/shm ramdisk."""
+    if os.access('/dev/shm', os.W_OK):
+        return tempfile.mkdtemp(prefix='plccache-', dir='/dev/shm')
+    return tempfile.mkdtemp(prefix='plccache-')
+
+
 class TestPlccache:
     """Test the plccache module"""
 
+    @pytest.fixture(scope='class', autouse=True)
+    @classmethod
+    def cache_root(cls, request):
+        """One shared temp directory for the whole class instead of a
+        mkdtemp/rmtree cycle per test"""
+        scratch = _make_scratch_dir()
+        request.cls.temp_cache_dir = scratch
+        yield scratch
+        shutil.rmtree(scratch, ignore_errors=True)
+
     def setup_method(self):
         """Set up test fixtures before each test"""
         # Reset global cache state
         plccache.cache = {}
         plccache.lang_concepts = {}
 
-        # Create temporary cache directory
-        self.temp_cache_dir = tempfile.mkdtemp()
-        self.original_cache_path = '.cache'
-
     def teardown_method(self):
         """Clean up after each test"""
-        # Remove temporary cache directory
-        if os.path.exists(self.temp_cache_dir):
-            shutil.rmtree(self.temp_cache_dir)
+        # Clear files left in the shared scratch dir by this test
+        for entry in os.scandir(self.temp_cache_dir):
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.remove(entry.path)
 
         # Reset global state
         plccache.cache = {}
         plccache.lang_concepts = {}
+        plccache.CACHE_DIR = '.cache'
+        plccache._dirty_langs.clear()
+        plccache._updates_since_flush = 0
 
     def test_load_creates_cache(self):
         """Test that load initializes cache correctly"""
@@ -42,25 +61,18 @@ class TestPlccache:
             }
         }
 
-        # Temporarily change cache directory
-        original_get_safename = helper.get_safename
         proglang = "Python 3.10"
 
-        # Mock the cache file path
-        cache_file = os.path.join(self.temp_cache_dir, f'{helper.get_safename(proglang)}.yaml')
+        # Point the cache root at the scratch dir and seed a cache file
+        plccache.CACHE_DIR = os.path.join(self.temp_cache_dir, '.cache')
+        cache_file = os.path.join(plccache.CACHE_DIR, f'{helper.get_safename(proglang)}.json')
+        helper.save_to_json(cache_file, {})
 
-        # Create cache directory
-        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        plccache.load(lang_concepts_yaml, proglang)
 
-        # Manually set up cache file for testing
-        helper.save_to_yaml(cache_file, {})
-
-        # Load with non-existent cache (should handle gracefully)
-        with tempfile.TemporaryDirectory() as tmpdir:
-            plccache.load(lang_concepts_yaml, proglang)
-
-        # Verify lang_concepts is set
+        # Verify lang_concepts is set and the seeded cache was read
         assert plccache.lang_concepts == lang_concepts_yaml
+        assert plccache.cache == {}
 
     def test_is_cache_exist_with_existing_cache(self):
         """Test cache existence check when cache exists"""
@@ -127,80 +139,68 @@ class TestPlccache:
 
     def test_update_creates_cache_entry(self):
         """Test that update creates a new cache entry"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Change cache directory temporarily
-            original_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            plccache.lang_concepts = {
-                'Datatypes': {
-                    'Primitives': 'Explain primitive types in {lang}'
-                }
-            }
-            plccache.cache = {}
+        # Point the cache root at the scratch dir instead of chdir-ing
+        plccache.CACHE_DIR = os.path.join(self.temp_cache_dir, '.cache')
 
-            proglang = "Python 3.10"
-            plccache.update(proglang, 'Datatypes', 'Primitives')
+        plccache.lang_concepts = {
+            'Datatypes': {
+                'Primitives': 'Explain primitive types in {lang}'
+            }
+        }
+        plccache.cache = {}
 
-            # Verify cache was updated
-            assert 'Datatypes' in plccache.cache
-            assert 'Primitives' in plccache.cache['Datatypes']
-            assert plccache.cache['Datatypes']['Primitives'] == 'Explain primitive types in {lang}'
+        proglang = "Python 3.10"
+        plccache.update(proglang, 'Datatypes', 'Primitives')
 
-            # Verify cache file was created
-            cache_file = f'.cache/{helper.get_safename(proglang)}.yaml'
-            assert os.path.exists(cache_file)
+        # Verify cache was updated
+        assert 'Datatypes' in plccache.cache
+        assert 'Primitives' in plccache.cache['Datatypes']
+        assert plccache.cache['Datatypes']['Primitives'] == 'Explain primitive types in {lang}'
 
-            # Restore original directory
-            os.chdir(original_cwd)
+        # Verify cache file was created after flushing pending updates
+        plccache.flush(proglang)
+        cache_file = os.path.join(plccache.CACHE_DIR, f'{helper.get_safename(proglang)}.json')
+        assert os.path.exists(cache_file)
 
     def test_update_preserves_existing_cache(self):
         """Test that update preserves existing cache entries"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            original_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            plccache.lang_concepts = {
-                'Datatypes': {
-                    'Primitives': 'Prompt 1',
-                    'Complex': 'Prompt 2'
-                }
+        plccache.CACHE_DIR = os.path.join(self.temp_cache_dir, '.cache')
+
+        plccache.lang_concepts = {
+            'Datatypes': {
+                'Primitives': 'Prompt 1',
+                'Complex': 'Prompt 2'
             }
-            plccache.cache = {
-                'Datatypes': {
-                    'Primitives': 'Prompt 1'
-                }
+        }
+        plccache.cache = {
+            'Datatypes': {
+                'Primitives': 'Prompt 1'
             }
+        }
 
-            proglang = "Python 3.10"
-            plccache.update(proglang, 'Datatypes', 'Complex')
-
-            # Verify both entries exist
-            assert 'Primitives' in plccache.cache['Datatypes']
-            assert 'Complex' in plccache.cache['Datatypes']
-            assert plccache.cache['Datatypes']['Primitives'] == 'Prompt 1'
-            assert plccache.cache['Datatypes']['Complex'] == 'Prompt 2'
+        proglang = "Python 3.10"
+        plccache.update(proglang, 'Datatypes', 'Complex')
 
-            os.chdir(original_cwd)
+        # Verify both entries exist
+        assert 'Primitives' in plccache.cache['Datatypes']
+        assert 'Complex' in plccache.cache['Datatypes']
+        assert plccache.cache['Datatypes']['Primitives'] == 'Prompt 1'
+        assert plccache.cache['Datatypes']['Complex'] == 'Prompt 2'
 
     def test_update_with_none_cache(self):
         """Test that update handles None cache gracefully"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            original_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            plccache.lang_concepts = {
-                'Datatypes': {
-                    'Primitives': 'Explain primitive types in {lang}'
-                }
-            }
-            plccache.cache = None
+        plccache.CACHE_DIR = os.path.join(self.temp_cache_dir, '.cache')
 
-            proglang = "Python 3.10"
-            plccache.update(proglang, 'Datatypes', 'Primitives')
+        plccache.lang_concepts = {
+            'Datatypes': {
+                'Primitives': 'Explain primitive types in {lang}'
+            }
+        }
+        plccache.cache = None
 
-            # Should create a new cache
-            assert plccache.cache is not None
-            assert 'Datatypes' in plccache.cache
+        proglang = "Python 3.10"
+        plccache.update(proglang, 'Datatypes', 'Primitives')
 
-            os.chdir(original_cwd)
+        # Should create a new cache
+        assert plccache.cache is not None
+        assert 'Datatypes' in plccache.cache
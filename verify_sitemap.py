@@ -5,43 +5,102 @@ Verify that all URLs in sitemap.xml correspond to existing files.
 
 import os
 import sys
-import xml.etree.ElementTree as ET
+
+# Prefer lxml's C parser when installed; the iterparse API used below
+# is source-compatible with the stdlib fallback
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# Site prefix every sitemap URL starts with
+BASE_URL = 'https://prog-lang-compare.netlify.app'
+
+# How many missing files to keep for the report; beyond this only count
+MISSING_SAMPLE_CAP = 50
+
+# Fully qualified sitemap tags, matched directly during the streaming parse
+_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+LOC_TAG = f'{{{_NS}}}loc'
+URL_TAG = f'{{{_NS}}}url'
+
+
+def _iter_sitemap_urls(sitemap_path):
+    """Yield URLs from the sitemap with a streaming parse.
+
+    iterparse keeps memory flat by clearing each processed <url> element
+    instead of building the whole DOM before walking it.
+    """
+    context = ET.iterparse(sitemap_path, events=('start', 'end'))
+    _, root = next(context)
+
+    for event, elem in context:
+        if event != 'end':
+            continue
+        if elem.tag == LOC_TAG:
+            yield elem.text
+        elif elem.tag == URL_TAG:
+            root.clear()
+
+
+def _existing_relpaths(docs_dir):
+    """Set of URL-style relative paths for every file under docs_dir.
+
+    scandir walks the tree without extra stat syscalls and the stored
+    paths are already normalized, so each URL check is one set probe
+    with no per-URL path joining.
+    """
+    existing = set()
+    prefix_len = len(docs_dir.rstrip(os.sep)) + 1
+    stack = [docs_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    existing.add(entry.path[prefix_len:].replace(os.sep, '/'))
+    return existing
+
 
 def verify_sitemap(sitemap_path, docs_dir):
-    """Parse sitemap and verify all URLs have corresponding files."""
+    """Parse sitemap and verify all URLs have corresponding files.
 
-    # Parse sitemap XML
-    tree = ET.parse(sitemap_path)
-    root = tree.getroot()
+    Returns (checked count, missing count, missing samples) — samples
+    are capped at MISSING_SAMPLE_CAP so a badly broken sitemap does not
+    balloon memory on paths nobody will read.
+    """
 
-    # XML namespace for sitemap
-    ns = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+    # One walk of the docs tree replaces a stat syscall per URL; each
+    # check below is then a set probe
+    existing = _existing_relpaths(docs_dir)
 
-    missing_files = []
-    checked_urls = []
+    checked_count = 0
+    missing_count = 0
+    missing_samples = []
 
     # Extract all URLs
-    for url_elem in root.findall('ns:url/ns:loc', ns):
-        url = url_elem.text
+    for url in _iter_sitemap_urls(sitemap_path):
 
-        # Remove domain to get path
-        path = url.replace('https://prog-lang-compare.netlify.app', '')
+        # Remove domain to get path — the prefix is always at position 0,
+        # so removeprefix beats a full-string replace scan
+        path = url.removeprefix(BASE_URL)
 
-        # Convert path to file path
-        if path == '/' or path == '':
-            file_path = os.path.join(docs_dir, 'index.html')
-        elif path.endswith('/'):
-            file_path = os.path.join(docs_dir, path[1:] + 'index.html')
-        else:
-            file_path = os.path.join(docs_dir, path[1:])
+        # Convert path to a relative file path; directory URLs map to
+        # their index.html
+        rel = path.lstrip('/')
+        if not rel or rel.endswith('/'):
+            rel += 'index.html'
 
-        checked_urls.append((url, file_path))
+        checked_count += 1
 
         # Check if file exists
-        if not os.path.exists(file_path):
-            missing_files.append((url, file_path))
+        if rel not in existing:
+            missing_count += 1
+            if len(missing_samples) < MISSING_SAMPLE_CAP:
+                missing_samples.append((url, f'{docs_dir}/{rel}'))
 
-    return checked_urls, missing_files
+    return checked_count, missing_count, missing_samples
 
 if __name__ == '__main__':
     sitemap_path = 'docs/sitemap.xml'
@@ -51,19 +110,19 @@ if __name__ == '__main__':
     print(f"Sitemap: {sitemap_path}")
     print(f"Base directory: {docs_dir}\n")
 
-    checked, missing = verify_sitemap(sitemap_path, docs_dir)
+    checked_count, missing_count, missing_samples = verify_sitemap(sitemap_path, docs_dir)
 
-    print(f"✓ Total URLs checked: {len(checked)}")
+    print(f"✓ Total URLs checked: {checked_count}")
 
-    if missing:
-        print(f"✗ Missing files (404s): {len(missing)}\n")
+    if missing_count:
+        print(f"✗ Missing files (404s): {missing_count}\n")
         print("Missing files:")
-        for url, file_path in missing[:50]:  # Show first 50
+        for url, file_path in missing_samples:
             print(f"  URL: {url}")
             print(f"  Expected file: {file_path}\n")
 
-        if len(missing) > 50:
-            print(f"  ... and {len(missing) - 50} more")
+        if missing_count > len(missing_samples):
+            print(f"  ... and {missing_count - len(missing_samples)} more")
 
         sys.exit(1)
     else: